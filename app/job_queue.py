@@ -12,6 +12,7 @@ Architecture:
 
 Components:
     - BurnJob: Data class representing individual burning jobs
+    - IsoView: Cached display fields derived from a job's ISO information
     - JobStatus: Enumeration of all possible job states
     - JobQueue: Thread-safe queue manager with processing logic
     - Integration with ISODownloadManager, JDFGenerator, and GraphQL API
@@ -44,14 +45,16 @@ Error Handling:
 """
 
 import logging
+import sys
 import threading
 import time
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.graphql_client import SyncGraphQLClient
 from app.iso_downloader import ISODownloadManager
@@ -61,6 +64,9 @@ from services.jdf_handler import JDFHandler
 
 app_config = Config.get_current_config()
 
+# Store BurnJob fields in __slots__ where dataclasses support it (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class JobStatus(Enum):
     """Job status enumeration."""
@@ -78,9 +84,41 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(frozen=True)
+class IsoView:
+    """Read-only display fields derived from a job's ISO information."""
+
+    filename: str
+    patient_name: str
+    patient_id: str
+    patient_display: str
+    study_description: str
+
+    @classmethod
+    def from_iso_info(cls, iso_info: Dict[str, Any]) -> "IsoView":
+        """Build the view from the ``iso_info`` dictionary returned by the API."""
+        study_info = iso_info.get("study", {})
+        patient_info = study_info.get("patient", {})
+        study_desc = study_info.get("dicomDescription") or "Sin descripción"
+        patient_name = patient_info.get("fullName", "Desconocido")
+        patient_id = patient_info.get("identifier", "N/A")
+
+        return cls(
+            filename=iso_info.get("filename", "Unknown"),
+            patient_name=patient_name,
+            patient_id=patient_id,
+            patient_display=f"{patient_name} (ID: {patient_id})",
+            study_description=f"{study_desc[:50]}..." if len(study_desc) > 50 else study_desc,
+        )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class BurnJob:
-    """Represents a disc burning job."""
+    """Represents a disc burning job.
+
+    On Python 3.10+ the fields live in ``__slots__``, so new attributes must be
+    declared as fields rather than assigned ad hoc.
+    """
 
     id: str
     iso_info: Dict[str, Any]
@@ -107,6 +145,87 @@ class BurnJob:
     # Disc type detection
     disc_type: Optional[str] = None  # "CD" or "DVD" or None if unknown
 
+    # Display cache for iso_info (see iso_view)
+    _iso_view: Optional[IsoView] = field(default=None, init=False, repr=False, compare=False)
+    _iso_view_source: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Display cache for the last segment of id (see id_short)
+    _id_short: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    # Display cache for created_at as (source value, formatted string)
+    _created_at_str: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Display cache for created_at with seconds as (source value, formatted string)
+    _created_at_full_str: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Display cache for updated_at as (source value, formatted string)
+    _updated_at_str: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def iso_view(self) -> IsoView:
+        """Display fields from ``iso_info``, rebuilt only when it is replaced."""
+        if self._iso_view is None or self._iso_view_source is not self.iso_info:
+            self._iso_view = IsoView.from_iso_info(self.iso_info)
+            self._iso_view_source = self.iso_info
+        return self._iso_view
+
+    @property
+    def id_short(self) -> str:
+        """Last segment of the job UUID, used as a compact display ID."""
+        if self._id_short is None:
+            self._id_short = self.id.rpartition("-")[2]
+        return self._id_short
+
+    @property
+    def created_at_str(self) -> str:
+        """``created_at`` as ``YYYY-MM-DD HH:MM``, reformatted only when it changes."""
+        cached = self._created_at_str
+        if cached is None or cached[0] != self.created_at:
+            cached = (self.created_at, self.created_at.strftime("%Y-%m-%d %H:%M"))
+            self._created_at_str = cached
+        return cached[1]
+
+    @property
+    def created_at_full_str(self) -> str:
+        """``created_at`` as ``YYYY-MM-DD HH:MM:SS``, reformatted only when it changes."""
+        cached = self._created_at_full_str
+        if cached is None or cached[0] != self.created_at:
+            cached = (self.created_at, self.created_at.strftime("%Y-%m-%d %H:%M:%S"))
+            self._created_at_full_str = cached
+        return cached[1]
+
+    @property
+    def updated_at_str(self) -> str:
+        """``updated_at`` as ``YYYY-MM-DD HH:MM:SS``, reformatted only when it changes."""
+        cached = self._updated_at_str
+        if cached is None or cached[0] != self.updated_at:
+            cached = (self.updated_at, self.updated_at.strftime("%Y-%m-%d %H:%M:%S"))
+            self._updated_at_str = cached
+        return cached[1]
+
+    @property
+    def patient_name(self) -> str:
+        """Patient full name from ``iso_info``, cached with the other display fields."""
+        return self.iso_view.patient_name
+
+    @property
+    def patient_display(self) -> str:
+        """Patient name and identifier formatted for display."""
+        return self.iso_view.patient_display
+
+    @property
+    def study_display_short(self) -> str:
+        """Study description truncated to 50 characters for display."""
+        return self.iso_view.study_description
+
     def detect_disc_type(self, file_path: str, job_queue: "JobQueue") -> str:
         """Detect disc type based on file size.
 
@@ -232,6 +351,7 @@ class JobQueue:
 
         # Callbacks
         self.job_update_callbacks: List[Callable[[BurnJob], None]] = []
+        self.jobs_removed_callbacks: List[Callable[[List[str]], None]] = []
 
         # Components
         self.download_manager = ISODownloadManager()
@@ -283,6 +403,27 @@ class JobQueue:
             except Exception as e:
                 self.logger.error(f"Error in job update callback: {e}")
 
+    def add_jobs_removed_callback(self, callback: Callable[[List[str]], None]):
+        """
+        Register a callback function for jobs removed from the queue.
+
+        Removed jobs get no further job updates, so components showing jobs
+        (like the GUI) use this to drop them.
+
+        Args:
+            callback: Function that accepts the list of removed job IDs.
+                     The callback should handle its own error conditions.
+        """
+        self.jobs_removed_callbacks.append(callback)
+
+    def _notify_jobs_removed(self, job_ids: List[str]):
+        """Notify all callbacks of removed jobs."""
+        for callback in self.jobs_removed_callbacks:
+            try:
+                callback(job_ids)
+            except Exception as e:
+                self.logger.error(f"Error in jobs removed callback: {e}")
+
     def add_job(self, iso_info: Dict[str, Any]) -> str:
         """
         Add a new burning job to the processing queue.
@@ -671,24 +812,26 @@ class JobQueue:
         return list(self.jobs.values())
 
     def get_queue_status(self) -> Dict[str, Any]:
-        """Get current queue status."""
-        with self.lock:
-            pending = len(self.get_jobs_by_status(JobStatus.PENDING))
-            downloading = len(self.get_jobs_by_status(JobStatus.DOWNLOADING))
-            burning = len(self.get_jobs_by_status(JobStatus.BURNING))
-            completed = len(self.get_jobs_by_status(JobStatus.COMPLETED))
-            failed = len(self.get_jobs_by_status(JobStatus.FAILED))
-
-            return {
-                "total_jobs": len(self.jobs),
-                "pending": pending,
-                "downloading": downloading,
-                "burning": burning,
-                "completed": completed,
-                "failed": failed,
-                "queue_length": len(self.job_queue),
-                "active_slots": min(app_config.max_concurrent_jobs, downloading + burning),
-            }
+        """Get current queue status.
+
+        Counts statuses in a single pass over a snapshot of the jobs instead of
+        taking the queue lock, so the GUI thread never waits on a worker holding
+        it (for example while retry_job removes files).
+        """
+        counts = Counter(job.status for job in list(self.jobs.values()))
+        downloading = counts[JobStatus.DOWNLOADING]
+        burning = counts[JobStatus.BURNING]
+
+        return {
+            "total_jobs": sum(counts.values()),
+            "pending": counts[JobStatus.PENDING],
+            "downloading": downloading,
+            "burning": burning,
+            "completed": counts[JobStatus.COMPLETED],
+            "failed": counts[JobStatus.FAILED],
+            "queue_length": len(self.job_queue),
+            "active_slots": min(app_config.max_concurrent_jobs, downloading + burning),
+        }
 
     def cleanup_completed_jobs(self, max_age_days: int = 7):
         """Clean up old completed jobs.
@@ -712,3 +855,6 @@ class JobQueue:
 
             if to_remove:
                 self.logger.info(f"Cleaned up {len(to_remove)} old jobs")
+
+        if to_remove:
+            self._notify_jobs_removed(to_remove)
@@ -2,8 +2,12 @@
 Job Details Dialog for EPSON PP-100 Disc Burner Application
 """
 
-from typing import Optional
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
 
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import (
     QDialog,
     QFormLayout,
@@ -19,6 +23,26 @@ from PyQt5.QtWidgets import (
 )
 
 from app.job_queue import BurnJob, JobStatus
+from config.config import Config
+
+app_config = Config.get_current_config()
+
+# Display text per status, built once instead of calling .title() on every refresh
+STATUS_TEXT = {status: status.value.title() for status in JobStatus}
+
+# Statuses in which a job has finished (can be retried, cannot be cancelled)
+FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+@contextmanager
+def block_signals(*widgets):
+    """Block the signals of the given widgets, restoring their previous state on exit."""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
 
 
 class JobDetailsDialogUI(QDialog):
@@ -29,14 +53,25 @@ class JobDetailsDialogUI(QDialog):
         self.job = job
         self.job_id = job.id
 
-        # Initialize UI only
-        self.setup_ui()
-
-    def setup_ui(self):
-        """Setup the dialog UI."""
         self.setWindowTitle(f"Detalles del Trabajo - {self.job.id[:16]}...")
         self.setMinimumSize(600, 500)
 
+        # Child widgets are created on first show (see showEvent)
+        self._initialized = False
+
+    def showEvent(self, event):
+        """Build the dialog widgets the first time the dialog is shown."""
+        if not self._initialized:
+            self.setup_ui()
+            self._initialized = True
+            self.on_ui_ready()
+        super().showEvent(event)
+
+    def on_ui_ready(self):
+        """Hook called once, right after the widgets have been created."""
+
+    def setup_ui(self):
+        """Setup the dialog UI."""
         layout = QVBoxLayout(self)
 
         # Job info group
@@ -85,19 +120,10 @@ class JobDetailsDialogUI(QDialog):
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
-        # Error message section (always present)
-        self.error_group = QGroupBox("Mensaje de Error")
-        self.error_group.setVisible(False)  # Hidden by default
-
-        error_layout = QVBoxLayout()
-        self.error_text = QTextEdit()
-        self.error_text.setMaximumHeight(100)
-        self.error_text.setReadOnly(True)
-        self.error_text.setText("")
-        error_layout.addWidget(self.error_text)
-
-        self.error_group.setLayout(error_layout)
-        layout.addWidget(self.error_group)
+        # Error message section (built on demand, see create_error_section)
+        self.error_group = None
+        self.error_text = None
+        self._last_error = ""  # Error message currently shown
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -116,10 +142,32 @@ class JobDetailsDialogUI(QDialog):
 
         layout.addLayout(button_layout)
 
+    def create_error_section(self):
+        """Create the error message section below the progress bar.
+
+        Most jobs never fail, so the group is only built the first time an
+        error has to be shown and is reused afterwards.
+        """
+        self.error_group = QGroupBox("Mensaje de Error")
+
+        error_layout = QVBoxLayout()
+        self.error_text = QTextEdit()
+        self.error_text.setMaximumHeight(100)
+        self.error_text.setReadOnly(True)
+        error_layout.addWidget(self.error_text)
+
+        self.error_group.setLayout(error_layout)
+
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(self.progress_bar) + 1, self.error_group)
+
 
 class JobDetailsDialogLogic(JobDetailsDialogUI):
     """Dialog logic class - inherits UI and adds business logic."""
 
+    # Signals
+    job_action_finished = pyqtSignal(str, bool)  # action, success
+
     def __init__(self, job: BurnJob, parent=None):
         # Initialize the UI base class first
         super().__init__(job, parent)
@@ -127,22 +175,89 @@ class JobDetailsDialogLogic(JobDetailsDialogUI):
         # Store reference to parent for job queue access
         self.parent_window = parent
 
-        # Then add business logic and initial data
-        self.update_job_details()
+        # Max retries from the application config; re-read in showEvent since a
+        # cached dialog can be shown again after the settings changed
+        self._max_retries = app_config.max_retries
+
+        # Job state last rendered by update_job_details
+        self._last_signature = None
+
+        # Text last written to each label, to skip unchanged setText calls
+        self._last_rendered: Dict[QLabel, str] = {}
 
         # Connect to parent for updates if available
-        if parent:
-            # Connect to job update signal from parent
-            parent.job_updated.connect(self.on_job_updated_from_parent)
+        self._connected_to_parent = False
+        self.connect_parent_updates()
 
+        # Results of cancel/retry actions run in a worker thread
+        self.action_running = False
+        self.job_action_finished.connect(self.on_job_action_finished)
+
+        self.logger = logging.getLogger(__name__)
+
+    def on_ui_ready(self):
+        """Connect the widgets and show the initial job data."""
         # Connect retry button
         self.retry_button.clicked.connect(self.on_retry_clicked)
 
         # Connect cancel button
         self.cancel_button.clicked.connect(self.on_cancel_clicked)
 
-    def on_cancel_clicked(self):
-        """Handle cancel button click."""
+        self.update_job_details()
+
+    def connect_parent_updates(self):
+        """Subscribe to job update signals from the parent window."""
+        if self.parent_window and not self._connected_to_parent:
+            self.parent_window.job_updated.connect(self.on_job_updated_from_parent)
+            self._connected_to_parent = True
+
+    def disconnect_parent_updates(self):
+        """Unsubscribe from job update signals from the parent window."""
+        if not self._connected_to_parent:
+            return
+
+        try:
+            self.parent_window.job_updated.disconnect(self.on_job_updated_from_parent)
+        except (TypeError, RuntimeError):
+            pass  # Already disconnected or parent destroyed
+        self._connected_to_parent = False
+
+    def showEvent(self, event):
+        """Resume job updates and catch up on changes missed while hidden."""
+        max_retries = app_config.max_retries
+        limit_changed = max_retries != self._max_retries
+        if limit_changed:
+            self._max_retries = max_retries
+            self._last_signature = None  # Re-render the retry button with the new limit
+
+        super().showEvent(event)
+        reconnect = self.parent_window and not self._connected_to_parent
+        if reconnect:
+            self.connect_parent_updates()
+        if reconnect or limit_changed:
+            self.update_job_details()
+
+    def hideEvent(self, event):
+        """Stop processing job updates while the dialog is hidden or minimized."""
+        self.disconnect_parent_updates()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        """Stop receiving job updates once the dialog is closed."""
+        self.disconnect_parent_updates()
+        super().closeEvent(event)
+
+    def done(self, result):
+        """Stop receiving job updates when the dialog is accepted or rejected."""
+        self.disconnect_parent_updates()
+        super().done(result)
+
+    def run_job_action(self, action: str):
+        """Run a job queue action ("cancel" or "retry") off the GUI thread.
+
+        The result is delivered back through the job_action_finished signal,
+        so the dialog keeps repainting and receiving job updates meanwhile.
+        """
         if not self.parent_window:
             return
 
@@ -151,12 +266,50 @@ class JobDetailsDialogLogic(JobDetailsDialogUI):
         if not job_queue:
             return
 
-        # Cancel the job
-        success = job_queue.cancel_job(self.job.id)
+        operation = job_queue.cancel_job if action == "cancel" else job_queue.retry_job
+        job_id = self.job.id
+
+        # Avoid double submissions while the action is running
+        self.retry_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+
+        def worker():
+            try:
+                success = operation(job_id)
+            except Exception as e:
+                self.logger.error(f"Error running {action} for job {job_id}: {e}")
+                success = False
+
+            # The dialog may have been deleted while the action ran
+            try:
+                self.job_action_finished.emit(action, success)
+            except RuntimeError:
+                pass
+
+        self.action_running = True
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_job_action_finished(self, action: str, success: bool):
+        """Handle the result of a job queue action."""
+        self.action_running = False
 
+        # Update dialog with new job state; force a full render so the buttons
+        # disabled while the action ran are restored even if the job is unchanged
+        self._last_signature = None
+        self.update_job_details()
+
+        if action == "cancel":
+            self.on_cancel_finished(success)
+        else:
+            self.on_retry_finished(success)
+
+    def on_cancel_clicked(self):
+        """Handle cancel button click."""
+        self.run_job_action("cancel")
+
+    def on_cancel_finished(self, success: bool):
+        """Handle the result of cancelling the job."""
         if success:
-            # Update dialog with new job state
-            self.update_job_details()
             # Show confirmation message
             QMessageBox.information(
                 self,
@@ -174,20 +327,11 @@ class JobDetailsDialogLogic(JobDetailsDialogUI):
 
     def on_retry_clicked(self):
         """Handle retry button click."""
-        if not self.parent_window:
-            return
-
-        # Get job queue from parent window
-        job_queue = getattr(self.parent_window, "job_queue", None)
-        if not job_queue:
-            return
-
-        # Retry the job
-        success = job_queue.retry_job(self.job.id)
+        self.run_job_action("retry")
 
+    def on_retry_finished(self, success: bool):
+        """Handle the result of retrying the job."""
         if success:
-            # Update dialog with new job state
-            self.update_job_details()
             # Close dialog since job is now pending again
             self.accept()
         else:
@@ -199,7 +343,7 @@ class JobDetailsDialogLogic(JobDetailsDialogUI):
 
     def on_job_updated_from_parent(self, job: BurnJob):
         """Handle job updates from parent window."""
-        if job.id == self.job_id:
+        if job.id == self.job_id and self.isVisible():
             self.job = job
             self.update_job_details()
 
@@ -208,62 +352,94 @@ class JobDetailsDialogLogic(JobDetailsDialogUI):
         if job:
             self.job = job
 
+        # Nothing to render until the widgets exist; the latest job is shown on first show
+        if not self._initialized:
+            return
+
+        # Skip the refresh when nothing displayed has changed since the last one
+        signature = (
+            self.job.status,
+            self.job.progress,
+            self.job.disc_type,
+            self.job.error_message,
+            self.job.retry_count,
+            self.job.created_at,
+            self.job.updated_at,
+            self.job.iso_view,
+        )
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+
+        # Widgets whose change signals (textChanged, valueChanged) would fire below
+        widgets = [self.job_id_txt, self.progress_bar]
+        if self.error_text is not None:
+            widgets.append(self.error_text)
+
+        # Suspend painting and change signals so the setters below collapse into
+        # a single repaint without notifying any observers
+        self.setUpdatesEnabled(False)
+        try:
+            with block_signals(*widgets):
+                self._render_job_details()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _render_job_details(self):
+        """Write the current job state into the dialog widgets."""
         # Update labels
         if self.job_id_txt.text() != self.job.id:
             self.job_id_txt.setText(self.job.id)
 
-        self.status_label.setText(self.job.status.value.title())
-        self.filename_label.setText(self.job.iso_info.get("filename", "Unknown"))
-
-        # Disc type
         disc_type_text = self.job.disc_type if self.job.disc_type else "No detectado"
-        self.disc_type_label.setText(disc_type_text)
-
-        # Patient information
-        study_info = self.job.iso_info.get("study", {})
-        patient_info = study_info.get("patient", {})
-        patient_name = patient_info.get("fullName", "Desconocido")
-        patient_id = patient_info.get("identifier", "N/A")
-        self.patient_label.setText(f"{patient_name} (ID: {patient_id})")
-
-        # Study information
-        study_desc = study_info.get("dicomDescription") or "Sin descripción"
-        self.study_label.setText(f"{study_desc[:50]}..." if len(study_desc) > 50 else study_desc)
-
-        self.progress_label.setText(f"{self.job.progress:.1f}%")
-        self.created_label.setText(self.job.created_at.strftime("%Y-%m-%d %H:%M:%S"))
-        self.updated_label.setText(self.job.updated_at.strftime("%Y-%m-%d %H:%M:%S"))
+        self.set_label_text(self.status_label, STATUS_TEXT[self.job.status])
+        self.set_label_text(self.filename_label, self.job.iso_view.filename)
+        self.set_label_text(self.disc_type_label, disc_type_text)
+        self.set_label_text(self.patient_label, self.job.patient_display)
+        self.set_label_text(self.study_label, self.job.study_display_short)
+        self.set_label_text(self.progress_label, f"{self.job.progress:.1f}%")
+        self.set_label_text(self.created_label, self.job.created_at_full_str)
+        self.set_label_text(self.updated_label, self.job.updated_at_str)
 
         # Update progress bar
         self.progress_bar.setValue(int(self.job.progress))
 
         # Update button states
-        # Get max retries from parent window's config if available
-        max_retries = 2  # default
-        if self.parent_window and hasattr(self.parent_window, "config"):
-            max_retries = self.parent_window.config.max_retries
-
+        finished = self.job.status in FINISHED_STATUSES
+        # Both stay disabled while a cancel/retry action is running
+        idle = not self.action_running
         self.retry_button.setEnabled(
-            self.job.status in [JobStatus.FAILED, JobStatus.COMPLETED, JobStatus.CANCELLED]
-            and self.job.retry_count < max_retries
-        )
-        self.cancel_button.setEnabled(
-            self.job.status not in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]
+            idle and finished and self.job.retry_count < self._max_retries
         )
+        self.cancel_button.setEnabled(idle and not finished)
 
         # Update error message section
         self.update_error_section()
 
+    def set_label_text(self, label: QLabel, text: str):
+        """Set a label's text, skipping the relayout when it did not change."""
+        if self._last_rendered.get(label) != text:
+            self._last_rendered[label] = text
+            label.setText(text)
+
     def update_error_section(self):
         """Update the error message section visibility and content."""
-        if self.job.error_message:
-            # Show error section and update content
+        message = self.job.error_message or ""
+        if message == self._last_error:
+            return
+        self._last_error = message
+
+        if message:
+            if self.error_group is None:
+                self.create_error_section()
+
+            # Show error section and update content (plain text, no HTML parsing)
+            self.error_text.setPlainText(message)
             self.error_group.setVisible(True)
-            self.error_text.setText(self.job.error_message)
-        else:
-            # Hide error section when no error
+        elif self.error_group is not None:
+            # Hide error section when no error (kept for reuse)
             self.error_group.setVisible(False)
-            self.error_text.setText("")
+            self.error_text.clear()
 
 
 # JobDetailsDialogLogic is the complete dialog class that combines UI and Logic
@@ -2,16 +2,283 @@
 Job Table Widget for EPSON PP-100 Disc Burner Application
 """
 
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
-from PyQt5.QtCore import Q_ARG, QMetaObject, Qt, pyqtSlot
-from PyQt5.QtGui import QColor
-from PyQt5.QtWidgets import QHeaderView, QProgressBar, QTableWidget, QTableWidgetItem
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QPoint, QRect, Qt
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPalette, QPixmap, QPixmapCache
+from PyQt5.QtWidgets import (
+    QApplication,
+    QHeaderView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
+    QTableView,
+)
 
 from app.job_queue import BurnJob, JobStatus
 
+# Chunk color shared by every progress bar in the table
+PROGRESS_CHUNK_COLOR = QColor("#004875")
 
-class JobTableWidgetUI(QTableWidget):
+# Text brushes, created once and shared by every cell (the view paints with brushes)
+WHITE = QBrush(QColor(255, 255, 255))
+DISC_TYPE_COLORS = {
+    "CD": QBrush(QColor(173, 216, 230)),  # Light blue for CD
+    "DVD": QBrush(QColor(144, 238, 144)),  # Light green for DVD
+    "Invalid": QBrush(QColor(255, 182, 193)),  # Light pink for invalid
+}
+UNKNOWN_DISC_TYPE_COLOR = QBrush(QColor(211, 211, 211))  # Light gray for unknown
+
+DISC_TYPE_TOOLTIPS = {disc_type: f"Tipo de disco: {disc_type}" for disc_type in DISC_TYPE_COLORS}
+UNKNOWN_DISC_TYPE_TOOLTIP = "Tipo de disco aún no detectado"
+
+# Progress bar per status: (bar filled with the progress, label, label takes the percentage)
+STATUS_PROGRESS = {
+    JobStatus.COMPLETED: (False, "✓ Completado", False),
+    JobStatus.FAILED: (False, "✗ Fallido", False),
+    JobStatus.CANCELLED: (False, "✗ Cancelado", False),
+    JobStatus.PENDING: (False, "⏳ Pendiente", False),
+    JobStatus.DOWNLOADING: (True, "📥 Descargando %d%%", True),
+    JobStatus.BURNING: (False, "🔥 Quemando %d%%", True),
+}
+DEFAULT_STATUS_PROGRESS = (False, "⏳ Esperando...", False)
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Item delegate that paints the progress column as a progress bar.
+
+    The model provides a ``(value, text)`` tuple under ``Qt.UserRole``; the bar is
+    drawn directly with the application style, so no QProgressBar widget is
+    created per row. Rendered bars are kept in QPixmapCache and reused.
+    """
+
+    def paint(self, painter, option, index):
+        progress = index.data(Qt.UserRole)
+        if progress is None:
+            super().paint(painter, option, index)
+            return
+
+        value, text = progress
+        rect = option.rect
+        ratio = painter.device().devicePixelRatioF()
+
+        # Rows sharing status, percentage, cell size and palette reuse one rendered bar
+        size = f"{rect.width()}x{rect.height()}@{ratio}"
+        style = f"{int(option.state)}:{option.palette.cacheKey()}"
+        key = f"job-progress:{value}:{text}:{size}:{style}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self.render_bar(option, value, text, ratio)
+            QPixmapCache.insert(key, pixmap)
+
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def render_bar(self, option, value: int, text: str, ratio: float) -> QPixmap:
+        """Render a progress bar of the cell's size into a pixmap."""
+        pixmap = QPixmap(option.rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        bar_option = QStyleOptionProgressBar()
+        bar_option.rect = QRect(QPoint(0, 0), option.rect.size())
+        bar_option.state = option.state
+        bar_option.direction = option.direction
+        bar_option.fontMetrics = option.fontMetrics
+        bar_option.palette = QPalette(option.palette)
+        bar_option.palette.setColor(QPalette.Highlight, PROGRESS_CHUNK_COLOR)
+        bar_option.minimum = 0
+        bar_option.maximum = 100
+        bar_option.progress = value
+        bar_option.text = text
+        bar_option.textVisible = True
+        bar_option.textAlignment = Qt.AlignmentFlag.AlignCenter
+
+        painter = QPainter(pixmap)
+        try:
+            QApplication.style().drawControl(QStyle.CE_ProgressBar, bar_option, painter)
+        finally:
+            painter.end()
+        return pixmap
+
+
+# Widest expected text of the columns sized from their content (ID, Type, Created)
+COLUMN_SAMPLE_TEXT = {0: "0123456789ab", 2: "Invalid", 4: "0000-00-00 00:00"}
+COLUMN_PADDING = 16  # Cell margins around the text, in pixels
+ROW_HEIGHT = 28  # Fixed height of every row, in pixels
+
+# Position of each role's per-column values in a row_data() tuple
+ROLE_SLOTS = {Qt.DisplayRole: 0, Qt.ForegroundRole: 1}
+
+
+class JobRowView(NamedTuple):
+    """Snapshot of everything a job row shows, built once per job update."""
+
+    job_id: str
+    state: tuple  # Values that can change while the job is displayed, see job_state()
+    cells: tuple  # Cell values, see row_data()
+
+    @classmethod
+    def from_job(cls, job: BurnJob) -> "JobRowView":
+        """Build the row snapshot of a job."""
+        percentage = int(job.progress)
+        return cls(job.id, job_state(job, percentage), row_data(job, percentage))
+
+
+class JobTableModel(QAbstractTableModel):
+    """Table model exposing a list of burn job rows to a view.
+
+    Rows are JobRowView snapshots prepared by the caller, so ``data`` only
+    indexes into a tuple and never reads the live BurnJob objects.
+    """
+
+    HEADERS = ["ID", "Paciente", "Tipo", "Estado", "Creado"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[JobRowView] = []
+        self._row_of_job: Dict[str, int] = {}  # Row index of each displayed job id
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        cells = row.cells
+        column = index.column()
+
+        if role == Qt.UserRole:
+            return cells[2] if column == 3 else None
+
+        if role == Qt.ToolTipRole:
+            # Built only for the cell being hovered
+            if column == 0:
+                return row.job_id
+            if column == 1:
+                return cells[0][1]
+            if column == 2:
+                return disc_type_tooltip(cells[0][2])
+            return None
+
+        slot = ROLE_SLOTS.get(role)
+        return None if slot is None else cells[slot][column]
+
+    def job_id_at(self, row: int) -> Optional[str]:
+        """Get the ID of the job shown on a row, or None if the row does not exist."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row].job_id
+        return None
+
+    def set_rows(self, rows: List[JobRowView]):
+        """Replace the displayed rows, emitting the smallest set of model signals.
+
+        Vanished jobs are removed, new jobs inserted in place and reordered jobs
+        moved, so the view keeps its selection. Only rows whose job state
+        changed emit ``dataChanged``.
+        """
+        new_id_set = {row.job_id for row in rows}
+
+        # Remove vanished jobs bottom-up so earlier row indexes stay valid
+        for index in range(len(self._rows) - 1, -1, -1):
+            if self._rows[index].job_id not in new_id_set:
+                self.beginRemoveRows(QModelIndex(), index, index)
+                del self._rows[index]
+                self.endRemoveRows()
+
+        # Walk the new list, moving or inserting rows into place and refreshing kept ones
+        remaining_ids = {row.job_id for row in self._rows}
+        last_column = self.columnCount() - 1
+        for index, row in enumerate(rows):
+            current = self._rows[index] if index < len(self._rows) else None
+            if current is None or current.job_id != row.job_id:
+                if row.job_id not in remaining_ids:
+                    self.beginInsertRows(QModelIndex(), index, index)
+                    self._rows.insert(index, row)
+                    self.endInsertRows()
+                    continue
+
+                source = next(
+                    position
+                    for position in range(index + 1, len(self._rows))
+                    if self._rows[position].job_id == row.job_id
+                )
+                self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), index)
+                self._rows.insert(index, self._rows.pop(source))
+                self.endMoveRows()
+                current = self._rows[index]
+
+            if row.state != current.state:
+                self._rows[index] = row
+                self.dataChanged.emit(self.index(index, 0), self.index(index, last_column))
+
+        self._row_of_job = {row.job_id: index for index, row in enumerate(self._rows)}
+
+    def update_rows(self, rows: List[JobRowView]):
+        """Refresh the rows of jobs already displayed, leaving the row order as is.
+
+        Rows for jobs that are not displayed are ignored.
+        """
+        last_column = self.columnCount() - 1
+        for row in rows:
+            index = self._row_of_job.get(row.job_id)
+            if index is None or self._rows[index].state == row.state:
+                continue
+            self._rows[index] = row
+            self.dataChanged.emit(self.index(index, 0), self.index(index, last_column))
+
+
+def job_state(job: BurnJob, percentage: int) -> tuple:
+    """Job values that can change while the job is displayed."""
+    return (job.status, percentage, job.patient_name, job.disc_type)
+
+
+def row_data(job: BurnJob, percentage: int) -> tuple:
+    """Build every value a job row shows, in one pass.
+
+    Args:
+        job: Job shown on the row
+        percentage: ``int(job.progress)``, computed once by the caller
+
+    Returns:
+        ``(display, foreground, progress)`` where the first two are per-column
+        tuples and ``progress`` is the ``(value, text)`` pair painted by
+        ProgressDelegate
+    """
+    patient_name = job.patient_name
+    disc_type = job.disc_type or ""
+    disc_color = DISC_TYPE_COLORS.get(disc_type, UNKNOWN_DISC_TYPE_COLOR)
+
+    display = (job.id_short, patient_name, disc_type, None, job.created_at_str)
+    foreground = (WHITE, WHITE, disc_color, None, WHITE)
+    return display, foreground, progress_display(job.status, percentage)
+
+
+def disc_type_tooltip(disc_type: str) -> str:
+    """Tooltip text for a disc type cell."""
+    if disc_type in DISC_TYPE_TOOLTIPS:
+        return DISC_TYPE_TOOLTIPS[disc_type]
+    return f"Tipo de disco: {disc_type}" if disc_type else UNKNOWN_DISC_TYPE_TOOLTIP
+
+
+def progress_display(status: JobStatus, percentage: int) -> tuple:
+    """Progress bar ``(value, text)`` for a job, as painted by ProgressDelegate."""
+    filled, label, with_percentage = STATUS_PROGRESS.get(status, DEFAULT_STATUS_PROGRESS)
+    progress_value = percentage if filled else 0
+    progress_text = label % percentage if with_percentage else label
+    return progress_value, progress_text
+
+
+class JobTableWidgetUI(QTableView):
     """Table widget UI class - handles only PyQt design and widget creation."""
 
     def __init__(self, parent=None):
@@ -20,35 +287,45 @@ class JobTableWidgetUI(QTableWidget):
         self.setup_table()
 
     def setup_table(self):
-        """Setup table headers and properties."""
-        headers = [
-            "ID",
-            "Paciente",
-            "Tipo",
-            "Estado",
-            "Creado",
-        ]
-
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
+        """Setup table model, headers and properties."""
+        self.job_model = JobTableModel(self)
+        self.setModel(self.job_model)
 
         # Configure table properties
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectRows)
-        self.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.setSelectionBehavior(QTableView.SelectRows)
+        self.setEditTriggers(QTableView.NoEditTriggers)
+        self.setVerticalScrollMode(QTableView.ScrollPerPixel)
 
-        # Resize columns
+        # All rows share one fixed height, so no row is measured individually
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setMinimumSectionSize(ROW_HEIGHT)
+        vertical_header.setDefaultSectionSize(ROW_HEIGHT)
+
+        # Resize columns; widths are computed once instead of measuring every cell
         header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Patient
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)  # Progress
 
-        # Set minimum column widths
-        self.setColumnWidth(0, 50)  # ID
-        self.setColumnWidth(1, 50)  # Patient
-        self.setColumnWidth(2, 50)  # Type
-        self.setColumnWidth(3, 200)  # Progress
-        self.setColumnWidth(4, 50)  # Created
+        metrics = self.fontMetrics()
+        self._column_widths = {
+            column: metrics.horizontalAdvance(text) + COLUMN_PADDING
+            for column, text in COLUMN_SAMPLE_TEXT.items()
+        }
+        self._column_widths[1] = 50  # Patient (stretches)
+        self._column_widths[3] = 200  # Progress
+        for column, width in self._column_widths.items():
+            self.setColumnWidth(column, width)
+
+        # Progress column is painted by a delegate instead of per-row widgets
+        self.setItemDelegateForColumn(3, ProgressDelegate(self))
+
+    def sizeHintForColumn(self, column):
+        """Return the precomputed column width instead of measuring every row."""
+        width = self._column_widths.get(column)
+        return width if width is not None else super().sizeHintForColumn(column)
 
 
 class JobTableWidgetLogic(JobTableWidgetUI):
@@ -58,91 +335,58 @@ class JobTableWidgetLogic(JobTableWidgetUI):
         # Initialize the UI base class first
         super().__init__(parent)
 
+        # Job ids and states last applied to the model
+        self._last_signature: Optional[tuple] = None
+
     def update_jobs(self, jobs: List[BurnJob]):
         """Update table with job data.
 
+        Must be called from the GUI thread; callers coalesce bursts of job
+        updates before calling it.
+
         Args:
             jobs: List of jobs to display
         """
-        # Schedule GUI update for main thread
-        QMetaObject.invokeMethod(self, "_update_jobs_gui", Qt.QueuedConnection, Q_ARG(list, jobs))
-
-    @pyqtSlot(list)
-    def _update_jobs_gui(self, jobs: List[BurnJob]):
-        """Update table GUI from main thread."""
-        self.setRowCount(len(jobs))
-
-        for row, job in enumerate(jobs):
-            # Job ID (truncated)
-            job_id_value = str(job.id).split("-")[-1]
-            job_id_item = QTableWidgetItem(job_id_value)
-            job_id_item.setToolTip(job.id)
-            job_id_item.setForeground(QColor(255, 255, 255))  # White text
-            self.setItem(row, 0, job_id_item)
-
-            # Patient information
-            study_info = job.iso_info.get("study", {})
-            patient_info = study_info.get("patient", {})
-            patient_name = patient_info.get("fullName", "Desconocido")
-            patient_item = QTableWidgetItem(patient_name)
-            patient_item.setToolTip(patient_name)
-            patient_item.setForeground(QColor(255, 255, 255))  # White text
-            self.setItem(row, 1, patient_item)
-
-            # Disc type
-            disc_type = job.disc_type or ""
-            disc_type_item = QTableWidgetItem(disc_type)
-
-            # Color code disc type
-            if disc_type == "CD":
-                disc_type_item.setForeground(QColor(173, 216, 230))  # Light blue for CD
-            elif disc_type == "DVD":
-                disc_type_item.setForeground(QColor(144, 238, 144))  # Light green for DVD
-            elif disc_type == "Invalid":
-                disc_type_item.setForeground(QColor(255, 182, 193))  # Light pink for invalid
-            else:
-                disc_type_item.setForeground(QColor(211, 211, 211))  # Light gray for unknown
-
-            disc_type_item.setToolTip(
-                f"Tipo de disco: {disc_type}" if disc_type else "Tipo de disco aún no detectado"
-            )
-            # disc_type_item.setForeground(QColor(0, 0, 0))  # Black text for better contrast
-            self.setItem(row, 2, disc_type_item)
-
-            # Progress bar with custom text (compact design)
-            progress_bar = QProgressBar()
-            progress_bar.setRange(0, 100)
-            progress_bar.setValue(int(job.progress))
-            progress_bar.setTextDirection(QProgressBar.Direction.TopToBottom)
-            progress_bar.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            # progress_bar.setFixedHeight(20)  # Compact height
-            progress_bar.setValue(0)  # Reset progress bar
-
-            progress_bar.setStyleSheet("QProgressBar::chunk { background-color: #004875; }")
-
-            # Set custom text based on status with enhanced dark theme colors
-            if job.status == JobStatus.COMPLETED:
-                progress_bar.setFormat("✓ Completado")
-            elif job.status == JobStatus.FAILED:
-                progress_bar.setFormat("✗ Fallido")
-            elif job.status == JobStatus.DOWNLOADING:
-                progress_bar.setValue(int(job.progress))
-                progress_bar.setFormat(f"📥 Descargando {int(job.progress)}%")
-            elif job.status == JobStatus.BURNING:
-                progress_bar.setFormat(f"🔥 Quemando {int(job.progress)}%")
-            elif job.status == JobStatus.CANCELLED:
-                progress_bar.setFormat("✗ Cancelado")
-            elif job.status == JobStatus.PENDING:
-                progress_bar.setFormat("⏳ Pendiente")
-            else:
-                progress_bar.setFormat("⏳ Esperando...")
-
-            self.setCellWidget(row, 3, progress_bar)
-
-            # Created time
-            created_item = QTableWidgetItem(job.created_at.strftime("%Y-%m-%d %H:%M"))
-            created_item.setForeground(QColor(255, 255, 255))  # White text
-            self.setItem(row, 4, created_item)
+        rows = [JobRowView.from_job(job) for job in jobs]
+
+        # Nothing to do when the jobs look exactly as they did on the last update
+        signature = tuple((row.job_id, row.state) for row in rows)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+
+        # Suspend painting, signals and sorting while the model is updated
+        sorting_enabled = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        self.setSortingEnabled(False)
+        try:
+            self.job_model.set_rows(rows)
+        finally:
+            self.setSortingEnabled(sorting_enabled)
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
+    def update_job_rows(self, jobs: List[BurnJob]):
+        """Refresh the rows of displayed jobs whose status and position did not change.
+
+        Must be called from the GUI thread. Only the given rows emit
+        ``dataChanged``; jobs that are not displayed are ignored.
+
+        Args:
+            jobs: Updated jobs
+        """
+        self.job_model.update_rows([JobRowView.from_job(job) for job in jobs])
+        self._last_signature = None  # The model no longer matches the last full update
+
+    def get_job_id_at(self, row: int) -> Optional[str]:
+        """Get the ID of the job shown on a row.
+
+        Returns:
+            Job ID or None if the row does not exist
+        """
+        return self.job_model.job_id_at(row)
 
     def get_selected_job_id(self) -> Optional[str]:
         """Get the ID of the currently selected job.
@@ -150,11 +394,9 @@ class JobTableWidgetLogic(JobTableWidgetUI):
         Returns:
             Job ID or None if no selection
         """
-        current_row = self.currentRow()
-        if current_row >= 0:
-            job_id_item = self.item(current_row, 0)
-            if job_id_item:
-                return job_id_item.toolTip()  # Full job ID is in tooltip
+        current_index = self.currentIndex()
+        if current_index.isValid():
+            return self.get_job_id_at(current_index.row())
         return None
 
 
@@ -2,6 +2,9 @@
 PyQt GUI for EPSON PP-100 Disc Burner Application - Main Window
 """
 
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
 from PyQt5.QtCore import QTimer, pyqtSignal
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import (
@@ -25,6 +28,21 @@ from gui.settings_dialog import SettingsDialog
 
 app_config = Config.get_current_config()
 
+# Delay used to coalesce bursts of job updates into one refresh, in milliseconds
+JOB_REFRESH_DELAY = 100
+
+# Number of job details dialogs kept alive for reuse
+DETAILS_DIALOG_CACHE_SIZE = 8
+
+# Job status shown by each filter button value
+FILTER_STATUSES = {
+    "pending": JobStatus.PENDING,
+    "downloading": JobStatus.DOWNLOADING,
+    "burning": JobStatus.BURNING,
+    "completed": JobStatus.COMPLETED,
+    "failed": JobStatus.FAILED,
+}
+
 
 class MainWindowUI(QMainWindow):
     """Main window UI class - handles only PyQt design and widget creation."""
@@ -221,6 +239,7 @@ class MainWindowLogic(MainWindowUI):
 
     # Signals
     job_updated = pyqtSignal(object)  # BurnJob
+    jobs_removed = pyqtSignal(list)  # job_ids
     job_completed = pyqtSignal(str)  # job_id
     job_failed = pyqtSignal(str)  # job_id
 
@@ -228,6 +247,17 @@ class MainWindowLogic(MainWindowUI):
         # Initialize the UI base class first
         super().__init__(job_queue)
 
+        # Sorted jobs for the current filter, reused until a job changes
+        self._display_jobs: Optional[List[BurnJob]] = None
+        self._display_jobs_filter: Optional[str] = None
+        self._display_statuses: Dict[str, JobStatus] = {}  # Status of each job when listed
+
+        # Listed jobs updated since the last refresh without changing status
+        self._changed_jobs: Dict[str, BurnJob] = {}
+
+        # Recently opened details dialogs by job id, least recently used first
+        self._details_dialogs: "OrderedDict[str, JobDetailsDialog]" = OrderedDict()
+
         # Then add business logic
         self.setup_connections()
         self.setup_timers()
@@ -236,8 +266,8 @@ class MainWindowLogic(MainWindowUI):
         self.refresh_data()
 
         # Connect UI signals to logic methods
-        self.job_table.itemDoubleClicked.connect(self.on_job_double_clicked)
-        self.refresh_button.clicked.connect(self.refresh_data)
+        self.job_table.doubleClicked.connect(self.on_job_double_clicked)
+        self.refresh_button.clicked.connect(self.reload_data)
         self.clear_completed_button.clicked.connect(self.clear_completed_jobs)
 
         # Connect menu actions
@@ -247,23 +277,77 @@ class MainWindowLogic(MainWindowUI):
         """Setup signal connections."""
         # Connect job queue signals
         self.job_queue.add_job_update_callback(self.on_job_updated)
+        self.job_queue.add_jobs_removed_callback(self.jobs_removed.emit)
 
     def on_job_updated(self, job: BurnJob):
-        """Handle job update signal."""
+        """Handle job update signal.
+
+        Called from worker threads. The job_updated signal delivers the update
+        to the GUI thread, where schedule_job_refresh debounces table refreshes.
+        """
         self.job_updated.emit(job)
-        self.refresh_job_display()
 
     def setup_timers(self):
         """Setup update timers."""
-        # Timer for refreshing data
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_data)
-        self.refresh_timer.start(app_config.gui_refresh_interval)
+        # Job updates are pushed by the job queue; bursts are debounced into one refresh
+        self.job_refresh_timer = QTimer(self)
+        self.job_refresh_timer.setSingleShot(True)
+        self.job_refresh_timer.setInterval(JOB_REFRESH_DELAY)
+        self.job_refresh_timer.timeout.connect(self.refresh_data)
+        self.job_updated.connect(self.schedule_job_refresh)
+        self.jobs_removed.connect(self.on_jobs_removed)
+
+        # Slow full reload while visible, catching changes that are not pushed
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setInterval(app_config.gui_refresh_interval)
+        self.reload_timer.timeout.connect(self.reload_data)
+
+    def schedule_job_refresh(self, job: BurnJob):
+        """Refresh displayed data shortly, unless a refresh is already scheduled."""
+        # Runs on the GUI thread, so it cannot race with refresh_job_display.
+        # A listed job keeping its status stays in the same place, so only its
+        # row needs refreshing. A listed job changing status, or an unlisted job
+        # now matching the filter, changes which jobs are listed; updates for
+        # other unlisted jobs leave the list as is.
+        listed_status = self._display_statuses.get(job.id)
+        if listed_status == job.status:
+            self._changed_jobs[job.id] = job
+        elif listed_status is not None or self.matches_filter(job):
+            self._display_jobs = None
+
+        # While hidden in the tray nothing is refreshed; showEvent catches up
+        if self.isVisible() and not self.job_refresh_timer.isActive():
+            self.job_refresh_timer.start()
+
+    def on_jobs_removed(self, job_ids: List[str]):
+        """Drop removed jobs from the display and their cached details dialogs."""
+        for job_id in job_ids:
+            self._changed_jobs.pop(job_id, None)
+            dialog = self._details_dialogs.get(job_id)
+            if dialog is not None and not dialog.isVisible():
+                del self._details_dialogs[job_id]
+                dialog.deleteLater()
+
+        self._display_jobs = None
+        if self.isVisible():
+            self.refresh_data()
+
+    def matches_filter(self, job: BurnJob) -> bool:
+        """Check whether a job belongs in the list for the active filter."""
+        filter_status = getattr(self, "current_filter", "all")
+        return filter_status == "all" or FILTER_STATUSES.get(filter_status) == job.status
+
+    def showEvent(self, event):
+        """Catch up on changes that were not pushed as job updates (e.g. loaded jobs)."""
+        super().showEvent(event)
+        self.reload_data()
+        self.reload_timer.start()
 
-        # Timer for updating status bar
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status_bar)
-        self.status_timer.start(5000)  # Every 5 seconds
+    def hideEvent(self, event):
+        """Drop any pending refresh while the window is hidden."""
+        self.job_refresh_timer.stop()
+        self.reload_timer.stop()
+        super().hideEvent(event)
 
     def on_filter_changed(self, filter_value):
         """Handle filter change."""
@@ -275,49 +359,74 @@ class MainWindowLogic(MainWindowUI):
         self.refresh_job_display()
         self.update_status_bar()
 
-    def on_job_double_clicked(self, item):
-        """Handle double click on job item."""
-        if item is None:
+    def reload_data(self):
+        """Re-read all jobs from the queue and refresh the displayed data."""
+        self._display_jobs = None
+        self.refresh_data()
+
+    def on_job_double_clicked(self, index):
+        """Handle double click on job row."""
+        if not index.isValid():
             return
 
         try:
-            row = item.row()
-            job_id_item = self.job_table.item(row, 0)
-
-            if job_id_item:
-                job_id = job_id_item.toolTip()  # Get full job ID from tooltip
-
-                if job_id:
-                    job = self.job_queue.get_job(job_id)
-                    if job:
-                        # Open job details dialog
-                        dialog = JobDetailsDialog(job, self)
-                        dialog.exec_()
-                    else:
-                        QMessageBox.warning(
-                            self,
-                            "Trabajo no encontrado",
-                            f"No se pudo encontrar el trabajo con ID: {job_id}",
-                        )
+            job_id = self.job_table.get_job_id_at(index.row())
+
+            if job_id:
+                job = self.job_queue.get_job(job_id)
+                if job:
+                    self.show_job_details(job)
+                else:
+                    QMessageBox.warning(
+                        self,
+                        "Trabajo no encontrado",
+                        f"No se pudo encontrar el trabajo con ID: {job_id}",
+                    )
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error al procesar doble clic: {e}")
 
+    def show_job_details(self, job: BurnJob):
+        """Show the details dialog for a job, reusing a recently opened one."""
+        dialog = self._details_dialogs.pop(job.id, None)
+        if dialog is None:
+            dialog = JobDetailsDialog(job, self)
+        else:
+            dialog.update_job_details(job)
+        self._details_dialogs[job.id] = dialog
+
+        # Keep only the most recently used dialogs alive; open dialogs and dialogs
+        # with a job action still running are never evicted
+        excess = len(self._details_dialogs) - DETAILS_DIALOG_CACHE_SIZE
+        for job_id, cached in list(self._details_dialogs.items()):
+            if excess <= 0:
+                break
+            if cached is dialog or cached.isVisible() or cached.action_running:
+                continue
+            del self._details_dialogs[job_id]
+            cached.deleteLater()
+            excess -= 1
+
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+
     def refresh_job_display(self):
         """Refresh the job table display."""
         filter_status = getattr(self, "current_filter", "all")
 
+        # Reuse the sorted list while no job changed status and the filter is the same
+        changed_jobs = list(self._changed_jobs.values())
+        self._changed_jobs.clear()
+        if self._display_jobs is not None and self._display_jobs_filter == filter_status:
+            if changed_jobs:
+                self.job_table.update_job_rows(changed_jobs)
+            return
+
         if filter_status == "all":
             jobs = self.job_queue.get_all_jobs()
         else:
             # Map filter to status
-            status_map = {
-                "pending": JobStatus.PENDING,
-                "downloading": JobStatus.DOWNLOADING,
-                "burning": JobStatus.BURNING,
-                "completed": JobStatus.COMPLETED,
-                "failed": JobStatus.FAILED,
-            }
-            status = status_map.get(filter_status)
+            status = FILTER_STATUSES.get(filter_status)
             if status:
                 jobs = self.job_queue.get_jobs_by_status(status)
             else:
@@ -326,6 +435,9 @@ class MainWindowLogic(MainWindowUI):
         # Sort jobs by creation time (newest first)
         jobs.sort(key=lambda x: x.created_at, reverse=True)
 
+        self._display_jobs = jobs
+        self._display_jobs_filter = filter_status
+        self._display_statuses = {job.id: job.status for job in jobs}
         self.job_table.update_jobs(jobs)
 
     def update_status_bar(self):
@@ -341,7 +453,9 @@ class MainWindowLogic(MainWindowUI):
                 f"Fallidos: {queue_status['failed']}"
             )
 
-            self.status_bar.showMessage(status_text)
+            # Only touch the status bar when the counts changed
+            if status_text != self.status_bar.currentMessage():
+                self.status_bar.showMessage(status_text)
 
         except Exception as e:
             self.status_bar.showMessage(f"Error updating status: {e}")
@@ -357,6 +471,9 @@ class MainWindowLogic(MainWindowUI):
         dialog = SettingsDialog(self)
         dialog.exec_()
 
+        # Apply a changed refresh interval without restarting
+        self.reload_timer.setInterval(app_config.gui_refresh_interval)
+
     def test_api_connection(self):
         """Test API connection."""
         try:
@@ -0,0 +1,120 @@
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from gui.job_table_widget import JobRowView, JobTableModel
+
+
+def make_row(job_id, state="pending"):
+    """Build a row snapshot without going through BurnJob."""
+    display = (job_id, "Paciente", "CD", None, "2024-01-01 00:00")
+    return JobRowView(job_id, (state,), (display, (None,) * 5, (0, state)))
+
+
+def make_rows(job_ids, states=None):
+    states = states or {}
+    return [make_row(job_id, states.get(job_id, "pending")) for job_id in job_ids]
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Fixture providing the headless QApplication the model needs."""
+    return QApplication.instance() or QApplication([])
+
+
+class TestJobTableModel:
+    """Test suite for JobTableModel.set_rows and update_rows."""
+
+    @pytest.fixture
+    def model(self, app):
+        """Fixture providing a model recording the signals it emits."""
+        model = JobTableModel()
+        model.events = []
+        model.rowsInserted.connect(lambda parent, first, last: model.events.append("insert"))
+        model.rowsRemoved.connect(lambda parent, first, last: model.events.append("remove"))
+        model.rowsMoved.connect(lambda *args: model.events.append("move"))
+        model.modelReset.connect(lambda: model.events.append("reset"))
+        model.dataChanged.connect(
+            lambda top_left, bottom_right: model.events.append(("changed", top_left.row()))
+        )
+        return model
+
+    @staticmethod
+    def displayed_ids(model):
+        return [model.job_id_at(row) for row in range(model.rowCount())]
+
+    def assert_rows(self, model, job_ids):
+        assert self.displayed_ids(model) == job_ids
+        assert model._row_of_job == {job_id: row for row, job_id in enumerate(job_ids)}
+
+    def test_insert_into_empty_model(self, model):
+        model.set_rows(make_rows(["a", "b", "c"]))
+        self.assert_rows(model, ["a", "b", "c"])
+        assert model.events == ["insert"] * 3
+
+    def test_insert_in_the_middle(self, model):
+        model.set_rows(make_rows(["a", "c"]))
+        model.events.clear()
+
+        model.set_rows(make_rows(["a", "b", "c"]))
+        self.assert_rows(model, ["a", "b", "c"])
+        assert model.events == ["insert"]
+
+    def test_remove(self, model):
+        model.set_rows(make_rows(["a", "b", "c", "d"]))
+        model.events.clear()
+
+        model.set_rows(make_rows(["a", "d"]))
+        self.assert_rows(model, ["a", "d"])
+        assert model.events == ["remove", "remove"]
+
+    def test_reorder_moves_rows(self, model):
+        model.set_rows(make_rows(["a", "b", "c", "d"]))
+        model.events.clear()
+
+        model.set_rows(make_rows(["d", "b", "a", "c"]))
+        self.assert_rows(model, ["d", "b", "a", "c"])
+        assert set(model.events) == {"move"}
+
+    def test_unchanged_state_emits_nothing(self, model):
+        model.set_rows(make_rows(["a", "b"]))
+        model.events.clear()
+
+        model.set_rows(make_rows(["a", "b"]))
+        self.assert_rows(model, ["a", "b"])
+        assert model.events == []
+
+    def test_changed_state_updates_only_that_row(self, model):
+        model.set_rows(make_rows(["a", "b", "c"]))
+        model.events.clear()
+
+        model.set_rows(make_rows(["a", "b", "c"], {"b": "burning"}))
+        assert model.events == [("changed", 1)]
+        assert model.data(model.index(1, 3), Qt.UserRole) == (0, "burning")
+
+    def test_update_rows_ignores_jobs_not_displayed(self, model):
+        model.set_rows(make_rows(["a", "b"]))
+        model.events.clear()
+
+        model.update_rows([make_row("b", "burning"), make_row("z", "burning")])
+        self.assert_rows(model, ["a", "b"])
+        assert model.events == [("changed", 1)]
+
+    def test_random_updates_match_the_new_order(self, model):
+        rng = random.Random(1234)
+        pool = [f"job-{index}" for index in range(12)]
+        for _ in range(100):
+            job_ids = rng.sample(pool, rng.randint(0, len(pool)))
+            states = {job_id: rng.choice(["pending", "burning"]) for job_id in job_ids}
+            model.set_rows(make_rows(job_ids, states))
+
+            self.assert_rows(model, job_ids)
+            progress = [model.data(model.index(row, 3), Qt.UserRole) for row in range(len(job_ids))]
+            assert [text for _, text in progress] == [states[job_id] for job_id in job_ids]
+        assert "reset" not in model.events